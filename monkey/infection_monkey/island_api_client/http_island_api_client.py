@@ -91,6 +91,7 @@ class HTTPIslandAPIClient(IIslandAPIClient):
         self._agent_event_serializer_registry = agent_event_serializer_registry
         self._http_client = http_client
         self._agent_id = agent_id
+        self._agent_log_endpoint = f"/agent-logs/{agent_id}"
         self._token_timer = EggTimer()
         self._token_refresh_lock = token_refresh_lock
 
@@ -231,10 +232,7 @@ class HTTPIslandAPIClient(IIslandAPIClient):
 
     @handle_authentication_token_expiration
     def send_log(self, log_contents: str):
-        self._http_client.put(
-            f"/agent-logs/{self._agent_id}",
-            log_contents,
-        )
+        self._http_client.put(self._agent_log_endpoint, log_contents)
 
     def terminate_signal_is_set(self) -> bool:
         agent_signals = self.get_agent_signals()
@@ -6,6 +6,7 @@ from . import IslandEventSubscriber
 
 class IslandEventTopic(Enum):
     AGENT_HEARTBEAT = auto()
+    AGENT_PLUGINS_CHANGED = auto()
     AGENT_REGISTERED = auto()
     AGENT_TIMED_OUT = auto()
     CLEAR_SIMULATION_DATA = auto()
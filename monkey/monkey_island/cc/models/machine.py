@@ -62,4 +62,4 @@ class Machine(MutableInfectionMonkeyBaseModel):
         return {str(addr): val for addr, val in value.items()}
 
     def __hash__(self):
-        return self.id
+        return hash(self.id)
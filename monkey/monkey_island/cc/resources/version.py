@@ -18,8 +18,10 @@ class Version(AbstractResource):
     @auth_token_required
     @roles_accepted(AccountRole.ISLAND_INTERFACE.name)
     def get(self):
+        latest_version, download_url = self._version.latest_version_info
+
         return {
             "version_number": self._version.version_number,
-            "latest_version": self._version.latest_version,
-            "download_link": self._version.download_url,
+            "latest_version": latest_version,
+            "download_link": download_url,
         }
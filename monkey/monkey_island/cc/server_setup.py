@@ -50,6 +50,8 @@ from monkey_island.cc.setup.mongo.mongo_db_process import MongoDbProcess  # noqa
 
 logger = logging.getLogger(__name__)
 
+DEPLOYMENT_FILE_PATH = Path(MONKEY_ISLAND_ABS_PATH) / "cc" / "deployment.json"
+
 
 def run_monkey_island():
     island_args = parse_cli_args()
@@ -112,18 +114,17 @@ def _collect_system_info() -> Tuple[Sequence[IPv4Address], Deployment, Version]:
 
 
 def _get_deployment() -> Deployment:
-    deployment_file_path = Path(MONKEY_ISLAND_ABS_PATH) / "cc" / "deployment.json"
     try:
-        with open(deployment_file_path, "r") as deployment_info_file:
+        with open(DEPLOYMENT_FILE_PATH, "r") as deployment_info_file:
             deployment_info = json.load(deployment_info_file)
             return Deployment[deployment_info["deployment"].upper()]
     except KeyError as err:
         raise Exception(
-            f"The deployment file ({deployment_file_path}) did not contain the expected data: "
+            f"The deployment file ({DEPLOYMENT_FILE_PATH}) did not contain the expected data: "
             f"missing key {err}"
         )
     except Exception as err:
-        raise Exception(f"Failed to fetch the deployment from {deployment_file_path}: {err}")
+        raise Exception(f"Failed to fetch the deployment from {DEPLOYMENT_FILE_PATH}: {err}")
 
 
 def _initialize_di_container(
@@ -1,3 +1,6 @@
+from threading import Lock
+from typing import Optional
+
 from common.agent_configuration import AgentConfiguration
 
 from . import IAgentConfigurationService
@@ -8,6 +11,10 @@ from .i_agent_configuration_repository import IAgentConfigurationRepository
 class AgentConfigurationService(IAgentConfigurationService):
     """
     A service for storing and retrieving the agent configuration.
+
+    The configuration is cached after it is first retrieved. The cache is cleared when the
+    configuration is updated or reset through this service, and by clear_cache(), which must be
+    called whenever the schema that the configuration is validated against changes.
     """
 
     def __init__(
@@ -17,15 +24,34 @@ class AgentConfigurationService(IAgentConfigurationService):
     ):
         self._repository = agent_configuration_repository
         self._schema_compiler = schema_compiler
+        self._agent_configuration: Optional[AgentConfiguration] = None
+        self._lock = Lock()
 
     def get_schema(self):
         return self._schema_compiler.get_schema()
 
     def get_configuration(self) -> AgentConfiguration:
-        return self._repository.get_configuration()
+        with self._lock:
+            if self._agent_configuration is None:
+                self._agent_configuration = self._repository.get_configuration()
+
+            # AgentConfiguration is mutable, so each caller gets its own copy to keep changes out of
+            # the cache
+            return self._agent_configuration.deep_copy()
 
     def update_configuration(self, agent_configuration: AgentConfiguration):
-        return self._repository.update_configuration(agent_configuration)
+        with self._lock:
+            self._agent_configuration = None
+            return self._repository.update_configuration(agent_configuration)
 
     def reset_to_default(self):
-        return self._repository.reset_to_default()
+        with self._lock:
+            self._agent_configuration = None
+            return self._repository.reset_to_default()
+
+    def clear_cache(self):
+        """
+        Clear the cached configuration so that it is retrieved and validated again
+        """
+        with self._lock:
+            self._agent_configuration = None
@@ -22,7 +22,7 @@ def build(container: DIContainer) -> IAgentConfigurationService:
     )
     container.register_instance(IAgentConfigurationService, agent_configuration_service)
 
-    _register_event_handlers(container)
+    _register_event_handlers(container, agent_configuration_service)
 
     return agent_configuration_service
 
@@ -43,10 +43,17 @@ def _decorate_agent_configuration_repository(
     return AgentConfigurationValidationDecorator(agent_configuration_repository, schema_compiler)
 
 
-def _register_event_handlers(container: DIContainer) -> None:
+def _register_event_handlers(
+    container: DIContainer, agent_configuration_service: AgentConfigurationService
+) -> None:
     island_event_queue = container.resolve(IIslandEventQueue)
 
     island_event_queue.subscribe(
         IslandEventTopic.RESET_AGENT_CONFIGURATION,
         container.resolve(reset_agent_configuration),
     )
+    # The configuration is validated against a schema that is compiled from the installed
+    # plugins, so a cached configuration may no longer be valid once the plugins change
+    island_event_queue.subscribe(
+        IslandEventTopic.AGENT_PLUGINS_CHANGED, agent_configuration_service.clear_cache
+    )
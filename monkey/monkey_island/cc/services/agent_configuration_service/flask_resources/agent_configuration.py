@@ -1,3 +1,4 @@
+import hashlib
 import json
 from http import HTTPStatus
 
@@ -23,8 +24,13 @@ class AgentConfiguration(AbstractResource):
     @roles_accepted(AccountRole.AGENT.name, AccountRole.ISLAND_INTERFACE.name)
     def get(self):
         configuration = self._agent_configuration_service.get_configuration()
-        configuration_dict = configuration.to_json_dict()
-        return make_response(configuration_dict, HTTPStatus.OK)
+        body = configuration.to_json().encode()
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+        response = make_response(body, HTTPStatus.OK, {"Content-Type": "application/json"})
+        response.set_etag(etag)
+
+        return response.make_conditional(request)
 
     @auth_token_required
     @roles_accepted(AccountRole.ISLAND_INTERFACE.name)
@@ -18,6 +18,7 @@ from common.decorators import request_cache
 from common.utils.file_utils import get_binary_io_sha256_hash
 from monkey_island.cc import Version
 from monkey_island.cc.deployment import Deployment
+from monkey_island.cc.event_queue import IIslandEventQueue, IslandEventTopic
 from monkey_island.cc.repositories import RetrievalError
 
 from . import IAgentPluginService
@@ -43,8 +44,10 @@ class AgentPluginService(IAgentPluginService):
         self,
         agent_plugin_repository: IAgentPluginRepository,
         version: Version,
+        island_event_queue: IIslandEventQueue,
     ):
         self._agent_plugin_repository = agent_plugin_repository
+        self._island_event_queue = island_event_queue
         self._lock = Lock()
 
         self._plugin_repository_url = AGENT_PLUGIN_REPOSITORY_RELEASE_2_3_0_URL
@@ -85,16 +88,20 @@ class AgentPluginService(IAgentPluginService):
                 raise PluginInstallationError("Failed to install the plugin") from err
 
             plugin = next(iter(os_agent_plugins.values()))
-            self._agent_plugin_repository.remove_agent_plugin(
-                agent_plugin_type=plugin.plugin_manifest.plugin_type,
-                agent_plugin_name=plugin.plugin_manifest.name,
-            )
-
-            for operating_system, agent_plugin in os_agent_plugins.items():
-                self._agent_plugin_repository.store_agent_plugin(
-                    operating_system=operating_system, agent_plugin=agent_plugin
+            try:
+                self._agent_plugin_repository.remove_agent_plugin(
+                    agent_plugin_type=plugin.plugin_manifest.plugin_type,
+                    agent_plugin_name=plugin.plugin_manifest.name,
                 )
 
+                for operating_system, agent_plugin in os_agent_plugins.items():
+                    self._agent_plugin_repository.store_agent_plugin(
+                        operating_system=operating_system, agent_plugin=agent_plugin
+                    )
+            finally:
+                # The installed plugins may have changed even if the installation failed part way
+                self._island_event_queue.publish(IslandEventTopic.AGENT_PLUGINS_CHANGED)
+
     def install_plugin_from_repository(
         self, plugin_type: AgentPluginType, plugin_name: PluginName, plugin_version: PluginVersion
     ):
@@ -164,3 +171,6 @@ class AgentPluginService(IAgentPluginService):
             raise PluginUninstallationError(
                 f"Failed to uninstall the plugin {plugin_name} of type {plugin_type}: {err}"
             )
+        finally:
+            # Some of the plugin may have been removed even if the uninstallation failed
+            self._island_event_queue.publish(IslandEventTopic.AGENT_PLUGINS_CHANGED)
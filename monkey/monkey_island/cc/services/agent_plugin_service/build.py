@@ -1,6 +1,7 @@
 from ophidian import DIContainer
 
 from monkey_island.cc import Version
+from monkey_island.cc.event_queue import IIslandEventQueue
 
 from .agent_plugin_repository_logging_decorator import AgentPluginRepositoryLoggingDecorator
 from .agent_plugin_service import AgentPluginService
@@ -12,7 +13,9 @@ from .mongo_agent_plugin_repository import MongoAgentPluginRepository
 def build(container: DIContainer) -> IAgentPluginService:
     undecorated_agent_plugin_repository = container.resolve(MongoAgentPluginRepository)
     agent_plugin_repository = _decorate_agent_plugin_repository(undecorated_agent_plugin_repository)
-    agent_plugin_service = AgentPluginService(agent_plugin_repository, container.resolve(Version))
+    agent_plugin_service = AgentPluginService(
+        agent_plugin_repository, container.resolve(Version), container.resolve(IIslandEventQueue)
+    )
     container.register_instance(IAgentPluginService, agent_plugin_service)
 
     return agent_plugin_service
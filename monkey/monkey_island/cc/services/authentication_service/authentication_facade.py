@@ -1,17 +1,17 @@
-import string
+import secrets
 import time
 from threading import Lock
-from typing import Sequence, Tuple
+from typing import Optional, Sequence, Tuple
 
-from flask_security import UserDatastore
+from flask_security import RoleMixin, UserDatastore
 from monkeytypes import OTP, Token
 
-from common.utils.code_utils import secure_generate_random_string
 from monkey_island.cc.event_queue import IIslandEventQueue, IslandEventTopic
 from monkey_island.cc.repositories import UnknownRecordError
 from monkey_island.cc.server_utils.encryption import ILockableEncryptor
 
 from . import AccountRole
+from .authentication_token_cache import AuthenticationTokenCache
 from .i_otp_repository import IOTPRepository
 from .user import User
 
@@ -30,14 +30,18 @@ class AuthenticationFacade:
         user_datastore: UserDatastore,
         otp_repository: IOTPRepository,
         token_ttl_sec: int,
+        authentication_token_cache: AuthenticationTokenCache,
     ):
         self._repository_encryptor = repository_encryptor
         self._island_event_queue = island_event_queue
         self._datastore = user_datastore
         self._otp_repository = otp_repository
         self._token_ttl_sec = token_ttl_sec
-        self._otp_read_lock = Lock()
+        self._authentication_token_cache = authentication_token_cache
         self._user_lock = Lock()
+        self._island_interface_role: Optional[RoleMixin] = None
+        # Once a user is registered, registration is no longer needed until that user is removed
+        self._island_interface_user_registered = False
 
     @property
     def token_ttl_sec(self) -> int:
@@ -49,10 +53,18 @@ class AuthenticationFacade:
 
         :return: Whether registration is required on the Island
         """
-        island_api_user_role = self._datastore.find_or_create_role(
-            name=AccountRole.ISLAND_INTERFACE.name
+        if self._island_interface_user_registered:
+            return False
+
+        if self._island_interface_role is None:
+            self._island_interface_role = self._datastore.find_or_create_role(
+                name=AccountRole.ISLAND_INTERFACE.name
+            )
+
+        self._island_interface_user_registered = bool(
+            self._datastore.find_user(roles=[self._island_interface_role])
         )
-        return not self._datastore.find_user(roles=[island_api_user_role])
+        return not self._island_interface_user_registered
 
     def remove_user(self, username: str):
         """
@@ -68,18 +80,22 @@ class AuthenticationFacade:
                 self.revoke_all_tokens_for_user(user)
                 self._datastore.delete_user(user)
 
+                if user.has_role(AccountRole.ISLAND_INTERFACE.name):
+                    self._island_interface_user_registered = False
+
     def revoke_all_tokens_for_user(self, user: User):
         """
         Revokes all tokens for a specific user
         """
         self._datastore.set_uniquifier(user)
+        self._authentication_token_cache.remove_tokens_for_user(user)
 
     def revoke_all_tokens_for_all_users(self):
         """
         Revokes all tokens for all users
         """
-        for user in User.objects:
-            self.revoke_all_tokens_for_user(user)
+        User.rotate_all_uniquifiers()
+        self._authentication_token_cache.clear()
 
     def generate_otp(self) -> OTP:
         """
@@ -87,7 +103,8 @@ class AuthenticationFacade:
 
         The generated OTP is saved to the `IOTPRepository`
         """
-        otp = OTP(secure_generate_random_string(32, string.ascii_letters + string.digits + "._-"))
+        # 24 random bytes are encoded as 32 URL-safe characters
+        otp = OTP(secrets.token_urlsafe(24))
         expiration_time = time.monotonic() + OTP_EXPIRATION_TIME
         self._otp_repository.insert_otp(otp, expiration_time)
 
@@ -106,27 +123,17 @@ class AuthenticationFacade:
             return Token(user.get_auth_token()), self._token_ttl_sec
 
     def authorize_otp(self, otp: OTP) -> bool:
-        # SECURITY: This method must not run concurrently, otherwise there could be TOCTOU errors,
-        # resulting in an OTP being used twice.
-        with self._otp_read_lock:
-            try:
-                otp_is_used = self._otp_repository.otp_is_used(otp)
-                # When this method is called, that constitutes the OTP being "used".
-                # Set it as used ASAP.
-                self._otp_repository.set_used(otp)
-
-                if otp_is_used:
-                    return False
-
-                if not self._otp_ttl_elapsed(otp):
-                    return True
+        # SECURITY: Claiming the OTP sets it as "used" in a single atomic operation, so an OTP can't
+        # be used twice even if this method runs concurrently.
+        try:
+            expiration_time = self._otp_repository.claim_otp(otp)
+        except UnknownRecordError:
+            return False
 
-                return False
-            except UnknownRecordError:
-                return False
+        if expiration_time is None:
+            return False
 
-    def _otp_ttl_elapsed(self, otp: OTP) -> bool:
-        return self._otp_repository.get_expiration(otp) < time.monotonic()
+        return expiration_time >= time.monotonic()
 
     def revoke_all_otps(self):
         self._otp_repository.reset()
@@ -155,15 +162,15 @@ class AuthenticationFacade:
     def _reset_repository_encryptor(self, username: str, password: str):
         secret = _get_secret_from_credentials(username, password)
         self._repository_encryptor.reset_key()
-        self._repository_encryptor.unlock(secret.encode())
+        self._repository_encryptor.unlock(secret)
 
     def handle_successful_login(self, username: str, password: str):
         self._unlock_repository_encryptor(username, password)
 
     def _unlock_repository_encryptor(self, username: str, password: str):
         secret = _get_secret_from_credentials(username, password)
-        self._repository_encryptor.unlock(secret.encode())
+        self._repository_encryptor.unlock(secret)
 
 
-def _get_secret_from_credentials(username: str, password: str) -> str:
-    return f"{username}:{password}"
+def _get_secret_from_credentials(username: str, password: str) -> bytes:
+    return f"{username}:{password}".encode()
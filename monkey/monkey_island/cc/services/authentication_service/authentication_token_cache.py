@@ -0,0 +1,117 @@
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
+
+from .user import User
+
+# SECURITY: Cached tokens are not re-verified, so keep this short to limit how long a token can
+# be used after it stops being valid for a reason the cache isn't told about
+AUTHENTICATION_TOKEN_CACHE_TTL = 10  # seconds
+AUTHENTICATION_TOKEN_CACHE_SIZE = 10_000
+
+
+class AuthenticationTokenCache:
+    """
+    A bounded, thread-safe cache of recently verified authentication tokens
+
+    Verifying a token requires checking its signature and looking up its owner in the user
+    datastore. This cache allows tokens that were verified in the last few seconds to be mapped
+    directly to their owners.
+    """
+
+    def __init__(
+        self,
+        ttl: float = AUTHENTICATION_TOKEN_CACHE_TTL,
+        maxsize: int = AUTHENTICATION_TOKEN_CACHE_SIZE,
+    ):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._cache: OrderedDict[str, Tuple[User, float]] = OrderedDict()
+        self._lock = Lock()
+        # Incremented whenever tokens are removed, so that a token that was verified before its
+        # removal is not added back afterwards
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        The current generation of the cache
+
+        Read this before verifying a token, and pass it to add() once the token is verified.
+        """
+        return self._generation
+
+    def get(self, token: str) -> Optional[User]:
+        """
+        Get the owner of a recently verified token
+
+        :param token: The authentication token
+        :return: The owner of the token, or None if the token is not cached or its entry expired
+        """
+        key = _hash_token(token)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            user, expiration_time = entry
+            if expiration_time <= time.time():
+                del self._cache[key]
+                return None
+
+            self._cache.move_to_end(key)
+            return user
+
+    def add(self, token: str, user: User, token_expiration_time: float, generation: int):
+        """
+        Cache the owner of a verified token
+
+        :param token: The verified authentication token
+        :param user: The owner of the token
+        :param token_expiration_time: The time when the token expires (in Unix time). The entry
+                                      never outlives the token.
+        :param generation: The generation of the cache before the token was verified. If tokens
+                           were removed since then, the token is not cached.
+        """
+        key = _hash_token(token)
+        expiration_time = min(time.time() + self._ttl, token_expiration_time)
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._cache[key] = (user, expiration_time)
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def remove_tokens_for_user(self, user: User):
+        """
+        Remove all of a user's tokens from the cache
+
+        :param user: The user whose tokens to remove
+        """
+        with self._lock:
+            self._generation += 1
+            user_keys = [
+                key for key, (cached_user, _) in self._cache.items() if cached_user.id == user.id
+            ]
+            for key in user_keys:
+                del self._cache[key]
+
+    def clear(self):
+        """
+        Remove all tokens from the cache
+        """
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+
+def _hash_token(token: str) -> str:
+    # SECURITY: Never keep the raw tokens around as keys
+    return hashlib.sha256(token.encode()).hexdigest()
@@ -6,12 +6,14 @@ from typing import Any, Dict
 from flask.sessions import SecureCookieSessionInterface
 from flask_mongoengine import MongoEngine
 from flask_security import ConfirmRegisterForm, MongoEngineUserDatastore, Security, UserDatastore
+from flask_security.utils import config_value, get_request_attr, set_request_attr
 from wtforms import StringField
 
 from common.utils.file_utils import open_new_securely_permissioned_file
 from monkey_island.cc.mongo_consts import MONGO_DB_HOST, MONGO_DB_NAME, MONGO_DB_PORT, MONGO_URL
 
 from . import AccountRole
+from .authentication_token_cache import AuthenticationTokenCache
 from .role import Role
 from .user import User
 
@@ -19,7 +21,9 @@ SECRET_FILE_NAME = ".flask_security_configuration.json"
 ACCESS_TOKEN_TTL = 15 * 60  # 15 minutes
 
 
-def configure_flask_security(app, data_dir: Path) -> Security:
+def configure_flask_security(
+    app, data_dir: Path, authentication_token_cache: AuthenticationTokenCache
+) -> Security:
     _setup_flask_mongo(app)
 
     flask_security_config = _generate_flask_security_configuration(data_dir)
@@ -63,6 +67,7 @@ def configure_flask_security(app, data_dir: Path) -> Security:
     # Force Security to always respond as an API rather than HTTP server
     # This will cause 401 response instead of 301 for unauthorized requests for example
     app.security._want_json = lambda _request: True
+    _cache_token_authentication(app.security, authentication_token_cache)
 
     app.session_interface = _disable_session_cookies()
 
@@ -101,6 +106,41 @@ def _create_roles(user_datastore: UserDatastore):
     user_datastore.find_or_create_role(name=AccountRole.AGENT.name)
 
 
+def _cache_token_authentication(
+    security: Security, authentication_token_cache: AuthenticationTokenCache
+):
+    # flask-login doesn't expose the registered request loader. Wrapping it deliberately relies on
+    # the private attribute, which holds flask-security's token verifying request loader.
+    verify_token = security.login_manager._request_callback
+
+    def cached_verify_token(request):
+        # The request loader is called more than once per request. Once the token has been
+        # authenticated, flask-security returns the same user without verifying the token again, so
+        # that result must not be cached.
+        if get_request_attr("fs_authn_via") == "token":
+            return verify_token(request)
+
+        token = request.headers.get(config_value("TOKEN_AUTHENTICATION_HEADER"))
+        if not token:
+            return verify_token(request)
+
+        user = authentication_token_cache.get(token)
+        if user is not None:
+            set_request_attr("fs_authn_via", "token")
+            return user
+
+        generation = authentication_token_cache.generation
+        user = verify_token(request)
+        if user.is_authenticated:
+            _, issued_at = security.remember_token_serializer.loads(token, return_timestamp=True)
+            token_expiration_time = issued_at.timestamp() + ACCESS_TOKEN_TTL
+            authentication_token_cache.add(token, user, token_expiration_time, generation)
+
+        return user
+
+    security.login_manager.request_loader(cached_verify_token)
+
+
 def _disable_session_cookies() -> SecureCookieSessionInterface:
     class CustomSessionInterface(SecureCookieSessionInterface):
         """Prevent creating session from API requests."""
@@ -1,6 +1,10 @@
+from typing import Any, Sequence, Tuple, Type
+
 import flask_restful
 from flask_limiter import Limiter
 
+from monkey_island.cc.flask_utils import AbstractResource
+
 from ..authentication_facade import AuthenticationFacade
 from ..i_otp_generator import IOTPGenerator
 from .agent_otp import AgentOTP
@@ -18,21 +22,15 @@ def register_resources(
     otp_generator: IOTPGenerator,
     limiter: Limiter,
 ):
-    api.add_resource(Register, *Register.urls, resource_class_args=(authentication_facade,))
-    api.add_resource(
-        RegistrationStatus, *RegistrationStatus.urls, resource_class_args=(authentication_facade,)
+    resources: Sequence[Tuple[Type[AbstractResource], Tuple[Any, ...]]] = (
+        (Register, (authentication_facade,)),
+        (RegistrationStatus, (authentication_facade,)),
+        (Login, (authentication_facade, limiter)),
+        (Logout, (authentication_facade,)),
+        (AgentOTP, (otp_generator, limiter)),
+        (AgentOTPLogin, (authentication_facade, limiter)),
+        (RefreshAuthenticationToken, (authentication_facade, limiter)),
     )
-    api.add_resource(Login, *Login.urls, resource_class_args=(authentication_facade, limiter))
-    api.add_resource(Logout, *Logout.urls, resource_class_args=(authentication_facade,))
 
-    api.add_resource(AgentOTP, *AgentOTP.urls, resource_class_args=(otp_generator, limiter))
-    api.add_resource(
-        AgentOTPLogin,
-        *AgentOTPLogin.urls,
-        resource_class_args=(authentication_facade, limiter),
-    )
-    api.add_resource(
-        RefreshAuthenticationToken,
-        *RefreshAuthenticationToken.urls,
-        resource_class_args=(authentication_facade, limiter),
-    )
+    for resource, resource_class_args in resources:
+        api.add_resource(resource, *resource.urls, resource_class_args=resource_class_args)
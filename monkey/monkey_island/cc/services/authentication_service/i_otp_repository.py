@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from monkeytypes import OTP
 
@@ -17,37 +18,16 @@ class IOTPRepository(ABC):
         """
 
     @abstractmethod
-    def set_used(self, otp: OTP):
+    def claim_otp(self, otp: OTP) -> Optional[float]:
         """
-        Update an OTP in the repository
+        Atomically set an OTP as "used" and get its expiration time
 
-        :param otp: The OTP set as "used"
+        :param otp: The OTP to claim
+        :return: The time that the OTP expires if it was unused, or None if it was already used
         :raises StorageError: If an error occurs while attempting to update the OTP
         :raises UnknownRecordError: If the OTP is not found in the repository
         """
 
-    @abstractmethod
-    def get_expiration(self, otp: OTP) -> float:
-        """
-        Get the expiration time of a given OTP
-
-        :param otp: The OTP for which to get the expiration time
-        :return: The time that the OTP expires
-        :raises RetrievalError: If an error occurs while attempting to retrieve the expiration time
-        :raises UnknownRecordError: If the OTP was not found
-        """
-
-    @abstractmethod
-    def otp_is_used(self, otp: OTP) -> bool:
-        """
-        Check if the OTP has already been used
-
-        :param otp: The OTP to check
-        :return: Whether the OTP has been used
-        :raises RetrievalError: If an error occurs while attempting to retrieve the OTP's usage
-        :raises UnknownRecordError: If the OTP was not found
-        """
-
     @abstractmethod
     def reset(self):
         """
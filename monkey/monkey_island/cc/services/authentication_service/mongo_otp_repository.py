@@ -1,16 +1,13 @@
 import hashlib
 import secrets
-from functools import lru_cache
-from typing import Any, Mapping
+from typing import Optional
 
-from bson.objectid import ObjectId
 from monkeytypes import OTP
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
 
 from monkey_island.cc.repositories import (
     MONGO_OBJECT_ID_KEY,
     RemovalError,
-    RetrievalError,
     StorageError,
     UnknownRecordError,
 )
@@ -52,52 +49,24 @@ class MongoOTPRepository(IOTPRepository):
         otp_bytes = otp.get_secret_value().encode()
         return hashlib.sha256(self._salt + otp_bytes).digest()
 
-    def set_used(self, otp: OTP):
+    def claim_otp(self, otp: OTP) -> Optional[float]:
         try:
-            otp_id = self._get_otp_object_id(otp)
-            self._otp_collection.update_one({MONGO_OBJECT_ID_KEY: otp_id}, {"$set": {"used": True}})
-        except UnknownRecordError as err:
-            raise err
-        except Exception as err:
-            raise StorageError(f"Error updating OTP: {err}")
-
-    def get_expiration(self, otp: OTP) -> float:
-        otp_dict = self._get_otp_document(otp)
-        return otp_dict["expiration_time"]
-
-    def otp_is_used(self, otp: OTP) -> bool:
-        otp_dict = self._get_otp_document(otp)
-        return otp_dict["used"]
-
-    def _get_otp_document(self, otp: OTP) -> Mapping[str, Any]:
-        otp_object_id = self._get_otp_object_id(otp)
-        retrieval_error_message = f"Error retrieving OTP with ID {otp_object_id}"
-
-        try:
-            otp_dict = self._otp_collection.find_one(
-                {"_id": otp_object_id}, {MONGO_OBJECT_ID_KEY: False}
-            )
-        except Exception as err:
-            raise RetrievalError(f"{retrieval_error_message}: {err}")
-
-        if otp_dict is None:
-            raise RetrievalError(retrieval_error_message)
-
-        return otp_dict
-
-    @lru_cache
-    def _get_otp_object_id(self, otp: OTP) -> ObjectId:
-        try:
-            otp_dict = self._otp_collection.find_one(
-                {"otp": self._hash_otp(otp)}, [MONGO_OBJECT_ID_KEY]
+            otp_dict = self._otp_collection.find_one_and_update(
+                {"otp": self._hash_otp(otp)},
+                {"$set": {"used": True}},
+                {MONGO_OBJECT_ID_KEY: False},
+                return_document=ReturnDocument.BEFORE,
             )
         except Exception as err:
-            raise RetrievalError(f"Error retrieving OTP: {err}")
+            raise StorageError(f"Error claiming OTP: {err}")
 
         if otp_dict is None:
             raise UnknownRecordError("OTP not found")
 
-        return otp_dict[MONGO_OBJECT_ID_KEY]
+        if otp_dict["used"]:
+            return None
+
+        return otp_dict["expiration_time"]
 
     def reset(self):
         try:
@@ -11,6 +11,7 @@ from monkey_island.cc.server_utils.encryption import ILockableEncryptor
 from . import IOTPGenerator
 from .authentication_facade import AuthenticationFacade
 from .authentication_service_otp_generator import AuthenticationServiceOTPGenerator
+from .authentication_token_cache import AuthenticationTokenCache
 from .configure_flask_security import configure_flask_security
 from .flask_resources import register_resources
 from .mongo_otp_repository import MongoOTPRepository
@@ -18,9 +19,12 @@ from .register_event_handlers import register_event_handlers
 
 
 def setup_authentication(api, app: Flask, container: DIContainer, data_dir: Path, limiter: Limiter):
-    security = configure_flask_security(app, data_dir)
+    authentication_token_cache = AuthenticationTokenCache()
+    security = configure_flask_security(app, data_dir, authentication_token_cache)
 
-    authentication_facade = _build_authentication_facade(container, security)
+    authentication_facade = _build_authentication_facade(
+        container, security, authentication_token_cache
+    )
     otp_generator = AuthenticationServiceOTPGenerator(authentication_facade)
     container.register_instance(IOTPGenerator, otp_generator)
 
@@ -32,7 +36,11 @@ def setup_authentication(api, app: Flask, container: DIContainer, data_dir: Path
     authentication_facade.revoke_all_otps()
 
 
-def _build_authentication_facade(container: DIContainer, security: Security):
+def _build_authentication_facade(
+    container: DIContainer,
+    security: Security,
+    authentication_token_cache: AuthenticationTokenCache,
+):
     repository_encryptor = container.resolve(ILockableEncryptor)
     island_event_queue = container.resolve(IIslandEventQueue)
 
@@ -42,4 +50,5 @@ def _build_authentication_facade(container: DIContainer, security: Security):
         security.datastore,
         container.resolve(MongoOTPRepository),
         security.app.config["SECURITY_TOKEN_MAX_AGE"],
+        authentication_token_cache,
     )
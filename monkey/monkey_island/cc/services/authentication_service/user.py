@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import uuid
+
 from flask_security import UserMixin
 from mongoengine import BooleanField, Document, ListField, ReferenceField, StringField
+from pymongo import UpdateOne
 
 from .role import Role
 
@@ -21,3 +24,17 @@ class User(Document, UserMixin):
     @staticmethod
     def get_by_id(id: str):
         return User.objects.get(id)
+
+    @staticmethod
+    def rotate_all_uniquifiers():
+        """
+        Give every user a new fs_uniquifier, invalidating all of their authentication tokens
+        """
+        # UserDatastore.set_uniquifier() saves one user at a time. This rotates every user's
+        # uniquifier in a single bulk write instead.
+        uniquifier_updates = [
+            UpdateOne({"_id": user_id}, {"$set": {"fs_uniquifier": uuid.uuid4().hex}})
+            for user_id in User.objects.scalar("id")
+        ]
+        if uniquifier_updates:
+            User._get_collection().bulk_write(uniquifier_updates, ordered=False)
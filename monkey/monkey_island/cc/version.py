@@ -1,5 +1,7 @@
 import logging
+import re
 from threading import Event, Thread
+from time import sleep
 from typing import Optional, Tuple
 
 import requests
@@ -9,6 +11,9 @@ from .deployment import Deployment
 # TODO get redirects instead of using direct links to AWS
 LATEST_VERSION_URL = "https://njf01cuupf.execute-api.us-east-1.amazonaws.com/default?deployment={}"
 LATEST_VERSION_TIMEOUT = 7
+LATEST_VERSION_RETRY_INTERVAL = 60 * 60  # seconds
+# e.g. "2.3.0" or "2.3.0+appimagev3"
+LATEST_VERSION_REGEX = re.compile(r"^\d+(?:\.\d+){1,3}(?:\+[\w.-]+)?\Z")
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +22,14 @@ class Version:
     """
     Information about the Island's version
 
-    Provides the current version, latest version, and download link for the latest version.
+    Provides the current version, latest version, and download URL for the latest version.
     """
 
     def __init__(self, version_number: str, deployment: Deployment):
         self._version_number = version_number
-        self._latest_version = None
-        self._download_url = None
+        # The latest version and its download URL are replaced together in a single assignment,
+        # so readers never see the version from one lookup with the URL from another
+        self._latest_version_info: Tuple[str, Optional[str]] = (version_number, None)
         self._deployment = deployment
         self._initialization_complete = Event()
 
@@ -37,20 +43,15 @@ class Version:
         return self._version_number
 
     @property
-    def latest_version(self):
+    def latest_version_info(self) -> Tuple[str, Optional[str]]:
         """
-        Latest available version of the island
-        """
-        self._initialization_complete.wait()
-        return self._latest_version
+        Latest available version of the island and the URL to download it from
 
-    @property
-    def download_url(self):
-        """
-        URL for the latest available version
+        The two are returned together because the latest version may be looked up again in the
+        background, and reading them separately could pair one lookup's version with another's URL.
         """
         self._initialization_complete.wait()
-        return self._download_url
+        return self._latest_version_info
 
     @property
     def deployment(self):
@@ -60,23 +61,43 @@ class Version:
         return self._deployment
 
     def _set_version_metadata(self):
-        self._latest_version, self._download_url = self._get_version_info()
-        self._initialization_complete.set()
+        # Only the first failure is reported at its full level, so that an Island that can't reach
+        # the version server doesn't log an error every hour
+        report_failures = True
+        while True:
+            version_info = self._get_version_info(report_failures)
+            if version_info is not None:
+                self._latest_version_info = version_info
 
-    def _get_version_info(self) -> Tuple[str, Optional[str]]:
+            self._initialization_complete.set()
+
+            if version_info is not None:
+                return
+
+            report_failures = False
+            logger.debug(f"Retrying the version lookup in {LATEST_VERSION_RETRY_INTERVAL} seconds")
+            sleep(LATEST_VERSION_RETRY_INTERVAL)
+
+    def _get_version_info(self, report_failures: bool) -> Optional[Tuple[str, str]]:
         url = LATEST_VERSION_URL.format(self._deployment.value)
+        log_warning = logger.warning if report_failures else logger.debug
+        log_error = logger.error if report_failures else logger.debug
 
         try:
             response = requests.get(url, timeout=LATEST_VERSION_TIMEOUT).json()
         except requests.exceptions.RequestException as err:
-            logger.warning(f"Failed to fetch version information from {url}: {err}")
-            return self._version_number, None
+            log_warning(f"Failed to fetch version information from {url}: {err}")
+            return None
 
         try:
             download_link = response["download_link"]
             latest_version = response["version"]
         except KeyError:
-            logger.error(f"Failed to fetch version information from {url}: {response}")
-            return self._version_number, None
+            log_error(f"Failed to fetch version information from {url}: {response}")
+            return None
+
+        if not isinstance(latest_version, str) or not LATEST_VERSION_REGEX.match(latest_version):
+            log_error(f"Received an invalid version from {url}: {latest_version}")
+            return None
 
         return latest_version, download_link
@@ -292,6 +292,20 @@ def test_island_api_client_send_events__serialization_failed():
         api_client.send_events(events=[Event3(source=AGENT_ID, c=1)])
 
 
+def test_island_api_client_send_log():
+    log_contents = "some log contents"
+    client_spy = MagicMock()
+    patch_login_with_valid_response(client_spy)
+    api_client = build_api_client(client_spy)
+    api_client.login(TEST_OTP)
+
+    api_client.send_log(log_contents)
+    api_client.send_log(log_contents)
+
+    assert client_spy.put.call_count == 2
+    client_spy.put.assert_called_with(f"/agent-logs/{AGENT_ID}", log_contents)
+
+
 def test_island_api_client__unhandled_exceptions():
     # Make sure errors not related to response parsing are not handled
     http_client_stub = MagicMock()
@@ -263,3 +263,11 @@ def test_set_network_services_default_value():
     m = Machine(**missing_network_services)
 
     assert m.network_services == {}
+
+
+def test_hash__uses_id():
+    m1 = Machine(**MACHINE_OBJECT_DICT)
+    m2 = Machine(**MACHINE_OBJECT_DICT)
+
+    assert hash(m1) == hash(m2) == hash(MACHINE_OBJECT_DICT["id"])
+    assert len({m1, m2}) == 1
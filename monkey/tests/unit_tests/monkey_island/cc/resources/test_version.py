@@ -0,0 +1,42 @@
+from http import HTTPStatus
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+from tests.common import StubDIContainer
+
+from monkey_island.cc import Version
+from monkey_island.cc.resources.version import Version as VersionResource
+
+VERSION_NUMBER = "1.0.0"
+LATEST_VERSION = "1.1.1"
+DOWNLOAD_URL = "http://be_free.gov"
+
+
+@pytest.fixture
+def mock_latest_version_info() -> PropertyMock:
+    return PropertyMock(return_value=(LATEST_VERSION, DOWNLOAD_URL))
+
+
+@pytest.fixture
+def flask_client(build_flask_client, mock_latest_version_info: PropertyMock):
+    version = MagicMock(spec=Version)
+    version.version_number = VERSION_NUMBER
+    type(version).latest_version_info = mock_latest_version_info
+
+    container = StubDIContainer()
+    container.register_instance(Version, version)
+
+    with build_flask_client(container) as flask_client:
+        yield flask_client
+
+
+def test_version(flask_client, mock_latest_version_info: PropertyMock):
+    resp = flask_client.get(VersionResource.urls[0], follow_redirects=True)
+
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json == {
+        "version_number": VERSION_NUMBER,
+        "latest_version": LATEST_VERSION,
+        "download_link": DOWNLOAD_URL,
+    }
+    mock_latest_version_info.assert_called_once()
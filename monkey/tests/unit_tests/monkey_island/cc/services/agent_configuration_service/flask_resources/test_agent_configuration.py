@@ -48,9 +48,35 @@ def test_agent_configuration_endpoint(flask_client):
     resp = flask_client.get(AGENT_CONFIGURATION_URL)
 
     assert resp.status_code == HTTPStatus.OK
+    assert resp.mimetype == "application/json"
     assert AgentConfiguration(**json.loads(resp.data)) == AgentConfiguration(**AGENT_CONFIGURATION)
 
 
+def test_agent_configuration_endpoint__not_modified(flask_client):
+    resp = flask_client.get(AGENT_CONFIGURATION_URL)
+    assert resp.status_code == HTTPStatus.OK
+
+    resp = flask_client.get(
+        AGENT_CONFIGURATION_URL, headers={"If-None-Match": resp.headers["ETag"]}
+    )
+
+    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_agent_configuration_endpoint__modified(flask_client):
+    resp = flask_client.get(AGENT_CONFIGURATION_URL)
+    etag = resp.headers["ETag"]
+    configuration = AgentConfiguration(**json.loads(resp.data))
+    configuration.keep_tunnel_open_time += 1
+    flask_client.put(AGENT_CONFIGURATION_URL, json=configuration.to_json_dict())
+
+    resp = flask_client.get(AGENT_CONFIGURATION_URL, headers={"If-None-Match": etag})
+
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    assert AgentConfiguration(**json.loads(resp.data)) == configuration
+
+
 @pytest.mark.parametrize(
     "error, expected_status",
     [
@@ -26,7 +26,7 @@ def agent_plugin_repository() -> InMemoryAgentPluginRepository:
 def agent_plugin_service(
     agent_plugin_repository: InMemoryAgentPluginRepository,
 ) -> IAgentPluginService:
-    return AgentPluginService(agent_plugin_repository, MagicMock())
+    return AgentPluginService(agent_plugin_repository, MagicMock(), MagicMock())
 
 
 @pytest.fixture
@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+
+import pytest
+from tests.common.example_agent_configuration import AGENT_CONFIGURATION
+
+from common.agent_configuration import AgentConfiguration
+from monkey_island.cc.services.agent_configuration_service.agent_configuration_schema_compiler import (  # noqa: E501
+    AgentConfigurationSchemaCompiler,
+)
+from monkey_island.cc.services.agent_configuration_service.agent_configuration_service import (
+    AgentConfigurationService,
+)
+from monkey_island.cc.services.agent_configuration_service.i_agent_configuration_repository import (  # noqa: E501
+    IAgentConfigurationRepository,
+)
+
+
+@pytest.fixture
+def mock_agent_configuration_repository() -> IAgentConfigurationRepository:
+    repository = MagicMock(spec=IAgentConfigurationRepository)
+    repository.get_configuration.return_value = AgentConfiguration(**AGENT_CONFIGURATION)
+
+    return repository
+
+
+@pytest.fixture
+def agent_configuration_service(
+    mock_agent_configuration_repository: IAgentConfigurationRepository,
+) -> AgentConfigurationService:
+    return AgentConfigurationService(
+        mock_agent_configuration_repository, MagicMock(spec=AgentConfigurationSchemaCompiler)
+    )
+
+
+def test_get_configuration__cached(
+    agent_configuration_service: AgentConfigurationService,
+    mock_agent_configuration_repository: IAgentConfigurationRepository,
+):
+    configuration_1 = agent_configuration_service.get_configuration()
+    configuration_2 = agent_configuration_service.get_configuration()
+
+    assert configuration_1 == configuration_2
+    mock_agent_configuration_repository.get_configuration.assert_called_once()
+
+
+def test_get_configuration__returns_copy(
+    agent_configuration_service: AgentConfigurationService,
+):
+    configuration = agent_configuration_service.get_configuration()
+    configuration.keep_tunnel_open_time = 999
+
+    assert agent_configuration_service.get_configuration() == AgentConfiguration(
+        **AGENT_CONFIGURATION
+    )
+
+
+def test_update_configuration__invalidates_cache(
+    agent_configuration_service: AgentConfigurationService,
+    mock_agent_configuration_repository: IAgentConfigurationRepository,
+):
+    agent_configuration_service.get_configuration()
+    agent_configuration_service.update_configuration(AgentConfiguration(**AGENT_CONFIGURATION))
+    agent_configuration_service.get_configuration()
+
+    assert mock_agent_configuration_repository.get_configuration.call_count == 2
+
+
+def test_reset_to_default__invalidates_cache(
+    agent_configuration_service: AgentConfigurationService,
+    mock_agent_configuration_repository: IAgentConfigurationRepository,
+):
+    agent_configuration_service.get_configuration()
+    agent_configuration_service.reset_to_default()
+    agent_configuration_service.get_configuration()
+
+    assert mock_agent_configuration_repository.get_configuration.call_count == 2
+
+
+def test_clear_cache(
+    agent_configuration_service: AgentConfigurationService,
+    mock_agent_configuration_repository: IAgentConfigurationRepository,
+):
+    agent_configuration_service.get_configuration()
+    agent_configuration_service.clear_cache()
+    agent_configuration_service.get_configuration()
+
+    assert mock_agent_configuration_repository.get_configuration.call_count == 2
@@ -24,7 +24,7 @@ def agent_plugin_repository():
 
 @pytest.fixture
 def agent_plugin_service(agent_plugin_repository):
-    return AgentPluginService(agent_plugin_repository, MagicMock())
+    return AgentPluginService(agent_plugin_repository, MagicMock(), MagicMock())
 
 
 @pytest.fixture
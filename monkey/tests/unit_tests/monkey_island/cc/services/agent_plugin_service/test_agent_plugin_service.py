@@ -13,6 +13,7 @@ from tests.unit_tests.monkey_island.cc.services.agent_plugin_service.conftest im
 from common.agent_plugins import AgentPluginRepositoryIndex, PluginName, PluginVersion
 from monkey_island.cc import Version
 from monkey_island.cc.deployment import Deployment
+from monkey_island.cc.event_queue import IIslandEventQueue, IslandEventTopic
 from monkey_island.cc.repositories import RetrievalError
 from monkey_island.cc.services.agent_plugin_service.agent_plugin_service import (
     AGENT_PLUGIN_REPOSITORY_DEVELOP_URL,
@@ -126,10 +127,17 @@ def agent_plugin_repository_index_simple(agent_plugin_repository_index_simple_fi
 
 
 @pytest.fixture
-def agent_plugin_service(agent_plugin_repository) -> IAgentPluginService:
+def mock_island_event_queue() -> IIslandEventQueue:
+    return MagicMock(spec=IIslandEventQueue)
+
+
+@pytest.fixture
+def agent_plugin_service(
+    agent_plugin_repository, mock_island_event_queue: IIslandEventQueue
+) -> IAgentPluginService:
     version = MagicMock(ispec=Version)
     version.deployment = Deployment.DEVELOP
-    return AgentPluginService(agent_plugin_repository, version)
+    return AgentPluginService(agent_plugin_repository, version, mock_island_event_queue)
 
 
 @pytest.mark.parametrize(
@@ -156,6 +164,20 @@ def test_agent_plugin_service__install_plugin_archive(
     assert agent_plugin_repository.store_agent_plugin.call_args[1]["operating_system"] is plugin_os
 
 
+def test_agent_plugin_service__install_plugin_archive_publishes_event(
+    plugin_data_dir: Path,
+    mock_island_event_queue: IIslandEventQueue,
+    agent_plugin_service: IAgentPluginService,
+    build_agent_plugin_tar_with_source_tar: Callable[[Path], BinaryIO],
+):
+    agent_plugin_tar = build_agent_plugin_tar_with_source_tar(
+        plugin_data_dir / "only-linux-vendor-plugin-source-input.tar"
+    )
+    agent_plugin_service.install_plugin_archive(agent_plugin_tar.getvalue())
+
+    mock_island_event_queue.publish.assert_called_once_with(IslandEventTopic.AGENT_PLUGINS_CHANGED)
+
+
 @pytest.mark.parametrize(
     "plugin_path_actual",
     ["multi-vendor-plugin-source-input.tar", "cross-platform-plugin-source.tar"],
@@ -174,9 +196,29 @@ def test_agent_plugin_service__install_plugin_archive_multi(
     assert agent_plugin_repository.store_agent_plugin.call_count == 2
 
 
+def test_agent_plugin_service__install_plugin_archive_store_error_publishes_event(
+    plugin_data_dir: Path,
+    agent_plugin_repository: IAgentPluginRepository,
+    mock_island_event_queue: IIslandEventQueue,
+    agent_plugin_service: IAgentPluginService,
+    build_agent_plugin_tar_with_source_tar: Callable[[Path], BinaryIO],
+):
+    agent_plugin_repository.store_agent_plugin.side_effect = Exception("store failed")
+    agent_plugin_tar = build_agent_plugin_tar_with_source_tar(
+        plugin_data_dir / "only-linux-vendor-plugin-source-input.tar"
+    )
+
+    with pytest.raises(Exception):
+        agent_plugin_service.install_plugin_archive(agent_plugin_tar.getvalue())
+
+    agent_plugin_repository.remove_agent_plugin.assert_called_once()
+    mock_island_event_queue.publish.assert_called_once_with(IslandEventTopic.AGENT_PLUGINS_CHANGED)
+
+
 def test_agent_plugin_service__plugin_install_error(
     simple_agent_plugin,
     plugin_data_dir: Path,
+    mock_island_event_queue: IIslandEventQueue,
     agent_plugin_service: IAgentPluginService,
     build_agent_plugin_tar_with_source_tar: Callable[[Path], BinaryIO],
 ):
@@ -186,6 +228,8 @@ def test_agent_plugin_service__plugin_install_error(
     with pytest.raises(PluginInstallationError):
         agent_plugin_service.install_plugin_archive(agent_plugin_tar.getvalue())
 
+    mock_island_event_queue.publish.assert_not_called()
+
 
 def test_agent_plugin_service__install_plugin_from_repository(monkeypatch, agent_plugin_service):
     mock_requests_get = MagicMock()
@@ -324,6 +368,7 @@ def test_agent_plugin_service__get_available_plugins_exception(
 
 def test_agent_plugin_service__unistall_agent_plugin_exception(
     agent_plugin_repository: IAgentPluginRepository,
+    mock_island_event_queue: IIslandEventQueue,
     agent_plugin_service: IAgentPluginService,
 ):
     def raise_exception(plugin_type, plugin_name):
@@ -335,6 +380,8 @@ def test_agent_plugin_service__unistall_agent_plugin_exception(
             plugin_type=AgentPluginType("Exploiter"), plugin_name="SSH"
         )
 
+    mock_island_event_queue.publish.assert_called_once_with(IslandEventTopic.AGENT_PLUGINS_CHANGED)
+
 
 def test_agent_plugin_service__unistall_agent_plugin(
     agent_plugin_repository: IAgentPluginRepository, agent_plugin_service: IAgentPluginService
@@ -346,3 +393,11 @@ def test_agent_plugin_service__unistall_agent_plugin(
     agent_plugin_repository.remove_agent_plugin.assert_called_with(
         agent_plugin_type=plugin_type, agent_plugin_name=plugin_name
     )
+
+
+def test_agent_plugin_service__unistall_agent_plugin_publishes_event(
+    mock_island_event_queue: IIslandEventQueue, agent_plugin_service: IAgentPluginService
+):
+    agent_plugin_service.uninstall_plugin(AgentPluginType("Exploiter"), "SSH")
+
+    mock_island_event_queue.publish.assert_called_once_with(IslandEventTopic.AGENT_PLUGINS_CHANGED)
@@ -1,4 +1,6 @@
+import re
 from pathlib import Path
+from typing import Optional, Sequence
 from unittest.mock import MagicMock, call
 
 import mongomock
@@ -15,6 +17,9 @@ from monkey_island.cc.server_utils.encryption import ILockableEncryptor
 from monkey_island.cc.services.authentication_service.authentication_facade import (
     AuthenticationFacade,
 )
+from monkey_island.cc.services.authentication_service.authentication_token_cache import (
+    AuthenticationTokenCache,
+)
 from monkey_island.cc.services.authentication_service.i_otp_repository import IOTPRepository
 from monkey_island.cc.services.authentication_service.mongo_otp_repository import MongoOTPRepository
 from monkey_island.cc.services.authentication_service.setup import setup_authentication
@@ -61,6 +66,11 @@ def mock_otp_repository() -> IOTPRepository:
     return MagicMock(spec=IOTPRepository)
 
 
+@pytest.fixture
+def mock_authentication_token_cache() -> AuthenticationTokenCache:
+    return MagicMock(spec=AuthenticationTokenCache)
+
+
 @pytest.fixture
 def authentication_facade(
     mock_flask_app,
@@ -68,6 +78,7 @@ def authentication_facade(
     mock_island_event_queue: IIslandEventQueue,
     mock_user_datastore: UserDatastore,
     mock_otp_repository: IOTPRepository,
+    mock_authentication_token_cache: AuthenticationTokenCache,
 ) -> AuthenticationFacade:
     return AuthenticationFacade(
         mock_repository_encryptor,
@@ -75,6 +86,7 @@ def authentication_facade(
         mock_user_datastore,
         mock_otp_repository,
         TOKEN_TTL_SEC,
+        mock_authentication_token_cache,
     )
 
 
@@ -91,6 +103,33 @@ def test_needs_registration__false(
     assert not authentication_facade.needs_registration()
 
 
+def test_needs_registration__caches_role_and_registration(
+    mock_user_datastore: UserDatastore, authentication_facade: AuthenticationFacade
+):
+    mock_user_datastore.find_user.return_value = False
+    authentication_facade.needs_registration()
+    mock_user_datastore.find_user.return_value = True
+    authentication_facade.needs_registration()
+
+    assert not authentication_facade.needs_registration()
+    mock_user_datastore.find_or_create_role.assert_called_once()
+    assert mock_user_datastore.find_user.call_count == 2
+
+
+def test_needs_registration__true_after_island_interface_user_removed(
+    mock_user_datastore: UserDatastore, authentication_facade: AuthenticationFacade
+):
+    user = MagicMock(spec=User)
+    user.has_role.return_value = True
+    mock_user_datastore.find_user.return_value = user
+    authentication_facade.needs_registration()
+
+    authentication_facade.remove_user(USERNAME)
+    mock_user_datastore.find_user.return_value = None
+
+    assert authentication_facade.needs_registration()
+
+
 def test_handle_successful_registration(
     mock_repository_encryptor: ILockableEncryptor,
     mock_island_event_queue: IIslandEventQueue,
@@ -140,6 +179,18 @@ def test_refresh_user_token(
     assert token_ttl_sec == TOKEN_TTL_SEC
 
 
+def test_revoke_all_tokens_for_user__removes_cached_tokens(
+    mock_authentication_token_cache: AuthenticationTokenCache,
+    authentication_facade: AuthenticationFacade,
+):
+    user = User(username=USERNAME, password=PASSWORD, fs_uniquifier="a")
+
+    authentication_facade.revoke_all_tokens_for_user(user)
+
+    mock_authentication_token_cache.remove_tokens_for_user.assert_called_once_with(user)
+    mock_authentication_token_cache.clear.assert_not_called()
+
+
 def test_remove_user__removes_user(
     mock_user_datastore: UserDatastore, authentication_facade: AuthenticationFacade
 ):
@@ -159,17 +210,28 @@ def test_remove_user__is_idempotent(
     authentication_facade.remove_user(USERNAME)
 
 
+def assert_uniquifiers_rotated(users: Sequence[User]):
+    for user in users:
+        assert User.objects.get(username=user.username).fs_uniquifier != user.fs_uniquifier
+
+    uniquifiers = set(User.objects.scalar("fs_uniquifier"))
+    assert len(uniquifiers) == len(users)
+
+
 def test_revoke_all_tokens_for_all_users(
-    mock_user_datastore: UserDatastore,
+    mock_authentication_token_cache: AuthenticationTokenCache,
     authentication_facade: AuthenticationFacade,
 ):
     for user in USERS:
         user.save(force_insert=True)
     authentication_facade.revoke_all_tokens_for_all_users()
 
-    assert mock_user_datastore.set_uniquifier.call_count == len(USERS)
-    for user in USERS:
-        mock_user_datastore.set_uniquifier.assert_any_call(user)
+    assert_uniquifiers_rotated(USERS)
+    mock_authentication_token_cache.clear.assert_called()
+
+
+def test_revoke_all_tokens_for_all_users__no_users(authentication_facade: AuthenticationFacade):
+    authentication_facade.revoke_all_tokens_for_all_users()
 
 
 def test_generate_otp__saves_otp(
@@ -180,38 +242,40 @@ def test_generate_otp__saves_otp(
     assert mock_otp_repository.insert_otp.call_args[0][0] == otp
 
 
+def test_generate_otp__url_safe(authentication_facade: AuthenticationFacade):
+    otp = authentication_facade.generate_otp()
+
+    assert re.fullmatch(r"[A-Za-z0-9_-]{32}", otp.get_secret_value())
+
+
 TIME = "2020-01-01 00:00:00"
 TIME_FLOAT = 1577836800.0
 
 
 @pytest.mark.parametrize(
-    "otp_is_used_return_value, get_expiration_return_value, otp_is_valid_expected_value",
+    "claim_otp_return_value, otp_is_valid_expected_value",
     [
-        (False, TIME_FLOAT - 1, False),  # not used, after expiration time
-        (True, TIME_FLOAT - 1, False),  # used, after expiration time
-        (False, TIME_FLOAT, True),  # not used, at expiration time
-        (True, TIME_FLOAT, False),  # used, at expiration time
-        (False, TIME_FLOAT + 1, True),  # not used, before expiration time
-        (True, TIME_FLOAT + 1, False),  # used, before expiration time
+        (TIME_FLOAT - 1, False),  # not used, after expiration time
+        (TIME_FLOAT, True),  # not used, at expiration time
+        (TIME_FLOAT + 1, True),  # not used, before expiration time
+        (None, False),  # used
     ],
 )
 def test_authorize_otp(
     authentication_facade: AuthenticationFacade,
     mock_otp_repository: IOTPRepository,
     freezer,
-    otp_is_used_return_value: bool,
-    get_expiration_return_value: int,
+    claim_otp_return_value: Optional[float],
     otp_is_valid_expected_value: bool,
 ):
     otp = OTP("secret")
 
     freezer.move_to(TIME)
 
-    mock_otp_repository.otp_is_used.return_value = otp_is_used_return_value
-    mock_otp_repository.get_expiration.return_value = get_expiration_return_value
+    mock_otp_repository.claim_otp.return_value = claim_otp_return_value
 
     assert authentication_facade.authorize_otp(otp) == otp_is_valid_expected_value
-    mock_otp_repository.set_used.assert_called_once()
+    mock_otp_repository.claim_otp.assert_called_once_with(otp)
 
 
 def test_authorize_otp__unknown_otp(
@@ -220,9 +284,7 @@ def test_authorize_otp__unknown_otp(
 ):
     otp = OTP("secret")
 
-    mock_otp_repository.otp_is_used.side_effect = UnknownRecordError(f"Unknown otp {otp}")
-    mock_otp_repository.set_used.side_effect = UnknownRecordError(f"Unknown otp {otp}")
-    mock_otp_repository.get_expiration.side_effect = UnknownRecordError(f"Unknown otp {otp}")
+    mock_otp_repository.claim_otp.side_effect = UnknownRecordError(f"Unknown otp {otp}")
 
     assert authentication_facade.authorize_otp(otp) is False
 
@@ -257,9 +319,7 @@ def test_setup_authentication__revokes_tokens(
     container.register_instance(pymongo.MongoClient, MockMongoClient())
     setup_authentication(MagicMock(), MagicMock(), container, Path("data_dir"), MagicMock())
 
-    assert mock_user_datastore.set_uniquifier.call_count == len(USERS)
-    for user in USERS:
-        mock_user_datastore.set_uniquifier.assert_any_call(user)
+    assert_uniquifiers_rotated(USERS)
 
 
 def test_setup_authentication__invalidates_otps(
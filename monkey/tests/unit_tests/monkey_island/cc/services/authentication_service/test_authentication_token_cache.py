@@ -0,0 +1,114 @@
+import time
+
+import pytest
+from bson import ObjectId
+
+from monkey_island.cc.services.authentication_service.authentication_token_cache import (
+    AuthenticationTokenCache,
+)
+from monkey_island.cc.services.authentication_service.user import User
+
+TOKEN = "token"
+USER = User(username="user1", password="test1", fs_uniquifier="a")
+TTL = 10
+
+
+@pytest.fixture
+def authentication_token_cache() -> AuthenticationTokenCache:
+    return AuthenticationTokenCache(ttl=TTL, maxsize=2)
+
+
+def test_get__unknown_token(authentication_token_cache: AuthenticationTokenCache):
+    assert authentication_token_cache.get(TOKEN) is None
+
+
+def test_get__cached_token(authentication_token_cache: AuthenticationTokenCache):
+    authentication_token_cache.add(
+        TOKEN, USER, time.time() + 60, authentication_token_cache.generation
+    )
+
+    assert authentication_token_cache.get(TOKEN) is USER
+
+
+def test_get__entry_expired(freezer, authentication_token_cache: AuthenticationTokenCache):
+    authentication_token_cache.add(
+        TOKEN, USER, time.time() + 60, authentication_token_cache.generation
+    )
+
+    freezer.tick(TTL)
+
+    assert authentication_token_cache.get(TOKEN) is None
+
+
+def test_get__token_expired(freezer, authentication_token_cache: AuthenticationTokenCache):
+    authentication_token_cache.add(
+        TOKEN, USER, time.time() + 1, authentication_token_cache.generation
+    )
+
+    freezer.tick(1)
+
+    assert authentication_token_cache.get(TOKEN) is None
+
+
+def test_add__evicts_least_recently_used(authentication_token_cache: AuthenticationTokenCache):
+    expiration_time = time.time() + 60
+    authentication_token_cache.add(
+        "token1", USER, expiration_time, authentication_token_cache.generation
+    )
+    authentication_token_cache.add(
+        "token2", USER, expiration_time, authentication_token_cache.generation
+    )
+    authentication_token_cache.get("token1")
+
+    authentication_token_cache.add(
+        "token3", USER, expiration_time, authentication_token_cache.generation
+    )
+
+    assert authentication_token_cache.get("token1") is USER
+    assert authentication_token_cache.get("token2") is None
+    assert authentication_token_cache.get("token3") is USER
+
+
+def test_remove_tokens_for_user(authentication_token_cache: AuthenticationTokenCache):
+    user_1 = User(id=ObjectId(), username="user1", password="test1", fs_uniquifier="a")
+    user_2 = User(id=ObjectId(), username="user2", password="test2", fs_uniquifier="b")
+    expiration_time = time.time() + 60
+    authentication_token_cache.add(
+        "token1", user_1, expiration_time, authentication_token_cache.generation
+    )
+    authentication_token_cache.add(
+        "token2", user_2, expiration_time, authentication_token_cache.generation
+    )
+
+    authentication_token_cache.remove_tokens_for_user(user_1)
+
+    assert authentication_token_cache.get("token1") is None
+    assert authentication_token_cache.get("token2") is user_2
+
+
+def test_clear(authentication_token_cache: AuthenticationTokenCache):
+    authentication_token_cache.add(
+        TOKEN, USER, time.time() + 60, authentication_token_cache.generation
+    )
+
+    authentication_token_cache.clear()
+
+    assert authentication_token_cache.get(TOKEN) is None
+
+
+@pytest.mark.parametrize(
+    "remove_tokens",
+    [
+        lambda cache: cache.remove_tokens_for_user(USER),
+        lambda cache: cache.clear(),
+    ],
+)
+def test_add__tokens_removed_since_verification(
+    authentication_token_cache: AuthenticationTokenCache, remove_tokens
+):
+    generation = authentication_token_cache.generation
+    remove_tokens(authentication_token_cache)
+
+    authentication_token_cache.add(TOKEN, USER, time.time() + 60, generation)
+
+    assert authentication_token_cache.get(TOKEN) is None
@@ -0,0 +1,214 @@
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock
+
+import mongoengine
+import mongomock
+import pytest
+from flask import Flask
+from flask_security import auth_token_required, current_user
+
+from common.utils.code_utils import insecure_generate_random_string
+from monkey_island.cc.services.authentication_service import (
+    configure_flask_security as configure_flask_security_module,
+)
+from monkey_island.cc.services.authentication_service.authentication_facade import (
+    AuthenticationFacade,
+)
+from monkey_island.cc.services.authentication_service.authentication_token_cache import (
+    AuthenticationTokenCache,
+)
+from monkey_island.cc.services.authentication_service.configure_flask_security import (
+    ACCESS_TOKEN_TTL,
+    configure_flask_security,
+)
+from monkey_island.cc.services.authentication_service.user import User
+
+PROTECTED_URL = "/protected"
+TOKEN_HEADER = "Authentication-Token"
+
+
+@pytest.fixture
+def authentication_token_cache() -> AuthenticationTokenCache:
+    # A TTL longer than the token's lifetime, so that only the token's expiration limits the entry
+    return AuthenticationTokenCache(ttl=ACCESS_TOKEN_TTL * 2)
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path: Path, authentication_token_cache: AuthenticationTokenCache) -> Flask:
+    def setup_mock_flask_mongo(app: Flask):
+        mongoengine.disconnect()
+        app.config["MONGODB_SETTINGS"] = [
+            {
+                "db": insecure_generate_random_string(8),
+                "host": "localhost",
+                "mongo_client_class": mongomock.MongoClient,
+            }
+        ]
+
+    monkeypatch.setattr(
+        configure_flask_security_module, "_setup_flask_mongo", setup_mock_flask_mongo
+    )
+
+    app = Flask(__name__)
+    app.config["SECURITY_PASSWORD_HASH"] = "plaintext"
+    configure_flask_security(app, tmp_path, authentication_token_cache)
+
+    @app.route(PROTECTED_URL)
+    @auth_token_required
+    def protected():
+        return current_user.username
+
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def authentication_facade(
+    app: Flask, authentication_token_cache: AuthenticationTokenCache
+) -> AuthenticationFacade:
+    return AuthenticationFacade(
+        MagicMock(),
+        MagicMock(),
+        app.security.datastore,
+        MagicMock(),
+        ACCESS_TOKEN_TTL,
+        authentication_token_cache,
+    )
+
+
+def create_user(app: Flask, username: str) -> User:
+    user = app.security.datastore.create_user(username=username, password="password")
+    app.security.datastore.commit()
+
+    return user
+
+
+def get_protected(app: Flask, token: Optional[str]):
+    headers = {TOKEN_HEADER: token} if token is not None else {}
+
+    # flask-login stores the current user in the application context, so each request needs a
+    # fresh one
+    with app.app_context():
+        return app.test_client().get(PROTECTED_URL, headers=headers)
+
+
+def test_token_is_cached(app: Flask, authentication_token_cache: AuthenticationTokenCache):
+    user = create_user(app, "user1")
+    token = user.get_auth_token()
+
+    response = get_protected(app, token)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == "user1"
+    assert authentication_token_cache.get(token) == user
+
+
+def test_cached_token_is_accepted(app: Flask, authentication_token_cache: AuthenticationTokenCache):
+    user = create_user(app, "user1")
+    # Not a valid token, so the request can only succeed if the cache is used
+    authentication_token_cache.add(
+        "cached-token", user, float("inf"), authentication_token_cache.generation
+    )
+
+    response = get_protected(app, "cached-token")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == "user1"
+
+
+def test_refreshed_token_is_rejected(app: Flask, authentication_facade: AuthenticationFacade):
+    user = create_user(app, "user1")
+    old_token = user.get_auth_token()
+    assert get_protected(app, old_token).status_code == HTTPStatus.OK
+
+    new_token, _ = authentication_facade.refresh_user_token(user)
+
+    assert get_protected(app, old_token).status_code == HTTPStatus.UNAUTHORIZED
+    assert get_protected(app, new_token.get_secret_value()).status_code == HTTPStatus.OK
+
+
+def test_revoked_token_is_rejected__other_users_stay_cached(
+    app: Flask,
+    authentication_token_cache: AuthenticationTokenCache,
+    authentication_facade: AuthenticationFacade,
+):
+    user_1 = create_user(app, "user1")
+    user_2 = create_user(app, "user2")
+    token_1 = user_1.get_auth_token()
+    token_2 = user_2.get_auth_token()
+    assert get_protected(app, token_1).status_code == HTTPStatus.OK
+    assert get_protected(app, token_2).status_code == HTTPStatus.OK
+
+    authentication_facade.revoke_all_tokens_for_user(user_1)
+
+    assert get_protected(app, token_1).status_code == HTTPStatus.UNAUTHORIZED
+    assert authentication_token_cache.get(token_2) == user_2
+
+
+def test_token_revoked_during_verification_is_not_cached(
+    monkeypatch,
+    app: Flask,
+    authentication_token_cache: AuthenticationTokenCache,
+    authentication_facade: AuthenticationFacade,
+):
+    user = create_user(app, "user1")
+    token = user.get_auth_token()
+    find_user = app.security.datastore.find_user
+
+    def find_user_then_revoke_tokens(*args, **kwargs):
+        found_user = find_user(*args, **kwargs)
+        # The token is revoked after its owner was looked up, but before it is cached
+        authentication_facade.revoke_all_tokens_for_user(User.objects.get(id=user.id))
+        return found_user
+
+    monkeypatch.setattr(app.security.datastore, "find_user", find_user_then_revoke_tokens)
+    get_protected(app, token)
+    monkeypatch.setattr(app.security.datastore, "find_user", find_user)
+
+    assert authentication_token_cache.get(token) is None
+    assert get_protected(app, token).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_all_revoked_tokens_are_rejected(app: Flask, authentication_facade: AuthenticationFacade):
+    tokens = [create_user(app, username).get_auth_token() for username in ("user1", "user2")]
+    for token in tokens:
+        assert get_protected(app, token).status_code == HTTPStatus.OK
+
+    authentication_facade.revoke_all_tokens_for_all_users()
+
+    for token in tokens:
+        assert get_protected(app, token).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_expired_token_is_not_served_from_cache(
+    freezer, app: Flask, authentication_token_cache: AuthenticationTokenCache
+):
+    user = create_user(app, "user1")
+    token = user.get_auth_token()
+    assert get_protected(app, token).status_code == HTTPStatus.OK
+
+    freezer.tick(ACCESS_TOKEN_TTL + 1)
+
+    assert authentication_token_cache.get(token) is None
+    assert get_protected(app, token).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_missing_token_is_rejected(app: Flask):
+    create_user(app, "user1")
+
+    response = get_protected(app, None)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_invalid_token_is_rejected(
+    app: Flask, authentication_token_cache: AuthenticationTokenCache
+):
+    create_user(app, "user1")
+
+    response = get_protected(app, "invalid-token")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert authentication_token_cache.get("invalid-token") is None
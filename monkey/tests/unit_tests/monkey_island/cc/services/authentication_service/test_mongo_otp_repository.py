@@ -5,12 +5,7 @@ import mongomock
 import pytest
 from monkeytypes import OTP
 
-from monkey_island.cc.repositories import (
-    RemovalError,
-    RetrievalError,
-    StorageError,
-    UnknownRecordError,
-)
+from monkey_island.cc.repositories import RemovalError, StorageError, UnknownRecordError
 from monkey_island.cc.services.authentication_service.i_otp_repository import IOTPRepository
 from monkey_island.cc.services.authentication_service.mongo_otp_repository import MongoOTPRepository
 
@@ -44,8 +39,7 @@ def error_raising_mongo_client() -> mongomock.MongoClient:
     client.monkey_island = MagicMock(spec=mongomock.Database)
     client.monkey_island.otp = MagicMock(spec=mongomock.Collection)
     client.monkey_island.otp.insert_one = MagicMock(side_effect=Exception("insert failed"))
-    client.monkey_island.otp.update_one = MagicMock(side_effect=Exception("insert failed"))
-    client.monkey_island.otp.find_one = MagicMock(side_effect=Exception("find failed"))
+    client.monkey_island.otp.find_one_and_update = MagicMock(side_effect=Exception("update failed"))
     client.monkey_island.otp.delete_one = MagicMock(side_effect=Exception("delete failed"))
     client.monkey_island.otp.drop = MagicMock(side_effect=Exception("drop failed"))
 
@@ -61,7 +55,7 @@ def error_raising_otp_repository(
 
 def test_insert_otp(otp_repository: IOTPRepository):
     otp_repository.insert_otp(OTPS[1].otp, 1)
-    assert otp_repository.get_expiration(OTPS[1].otp) == 1
+    assert otp_repository.claim_otp(OTPS[1].otp) == 1
 
 
 def test_insert_otp__prevents_duplicates(otp_repository: IOTPRepository):
@@ -85,28 +79,6 @@ def test_insert_otp__raises_storage_error_if_error_occurs(
         error_raising_otp_repository.insert_otp("test_otp", 1)
 
 
-def test_get_expiration__raises_unknown_record_error_if_otp_does_not_exist(
-    otp_repository: IOTPRepository,
-):
-    with pytest.raises(UnknownRecordError):
-        otp_repository.get_expiration(OTPS[2].otp)
-
-
-@pytest.mark.parametrize("OTP", OTPS)
-def test_get_expiration__returns_expiration_if_otp_exists(
-    OTP: OTPData, otp_repository: IOTPRepository
-):
-    otp_repository.insert_otp(OTP.otp, OTP.expiration_time)
-    assert otp_repository.get_expiration(OTP.otp) == OTP.expiration_time
-
-
-def test_get_expiration__raises_retrieval_error_if_error_occurs(
-    error_raising_otp_repository: IOTPRepository,
-):
-    with pytest.raises(RetrievalError):
-        error_raising_otp_repository.get_expiration(OTPS[0].otp)
-
-
 def test_reset__deletes_all_otp(otp_repository: IOTPRepository):
     for o in OTPS:
         otp_repository.insert_otp(o.otp, o.expiration_time)
@@ -115,7 +87,7 @@ def test_reset__deletes_all_otp(otp_repository: IOTPRepository):
 
     for o in OTPS:
         with pytest.raises(UnknownRecordError):
-            otp_repository.get_expiration(o.otp)
+            otp_repository.claim_otp(o.otp)
 
 
 def test_reset__raises_removal_error_if_error_occurs(error_raising_otp_repository: IOTPRepository):
@@ -123,34 +95,33 @@ def test_reset__raises_removal_error_if_error_occurs(error_raising_otp_repositor
         error_raising_otp_repository.reset()
 
 
-def test_set_used(otp_repository: IOTPRepository):
+def test_claim_otp(otp_repository: IOTPRepository):
     otp = OTP("test_otp")
     otp_repository.insert_otp(otp, 1)
-    assert not otp_repository.otp_is_used(otp)
-
-    otp_repository.set_used(otp)
-    assert otp_repository.otp_is_used(otp)
 
+    assert otp_repository.claim_otp(otp) == 1
 
-def test_set_used__storage_error(
-    error_raising_mongo_client: mongomock.MongoClient, error_raising_otp_repository: IOTPRepository
-):
-    error_raising_mongo_client.monkey_island.otp.find_one.side_effect = None
-    with pytest.raises(StorageError):
-        error_raising_otp_repository.set_used(OTP("test_otp"))
 
-
-def test_set_used__unknown_record_error(otp_repository: IOTPRepository):
-    with pytest.raises(UnknownRecordError):
-        otp_repository.set_used(OTP("test_otp"))
+@pytest.mark.parametrize("OTP", OTPS)
+def test_claim_otp__returns_expiration(OTP: OTPData, otp_repository: IOTPRepository):
+    otp_repository.insert_otp(OTP.otp, OTP.expiration_time)
+    assert otp_repository.claim_otp(OTP.otp) == OTP.expiration_time
 
 
-def test_set_used__idempotent(otp_repository: IOTPRepository):
+def test_claim_otp__already_used(otp_repository: IOTPRepository):
     otp = OTP("test_otp")
     otp_repository.insert_otp(otp, 1)
 
-    otp_repository.set_used(otp)
-    otp_repository.set_used(otp)
-    otp_repository.set_used(otp)
+    otp_repository.claim_otp(otp)
+
+    assert otp_repository.claim_otp(otp) is None
 
-    assert otp_repository.otp_is_used(otp)
+
+def test_claim_otp__storage_error(error_raising_otp_repository: IOTPRepository):
+    with pytest.raises(StorageError):
+        error_raising_otp_repository.claim_otp(OTP("test_otp"))
+
+
+def test_claim_otp__unknown_record_error(otp_repository: IOTPRepository):
+    with pytest.raises(UnknownRecordError):
+        otp_repository.claim_otp(OTP("test_otp"))
@@ -1,3 +1,5 @@
+import logging
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,10 +20,18 @@ successful_response.return_value.json.return_value = {
 }
 
 
+invalid_version_response = MagicMock()
+invalid_version_response.return_value.json.return_value = {
+    "version": "not-a-version",
+    "download_link": SUCCESS_URL,
+}
+
+
 @pytest.mark.parametrize(
     "request_mock",
     [
         failed_response,
+        invalid_version_response,
         MagicMock(side_effect=requests.exceptions.RequestException("Timeout or something")),
     ],
 )
@@ -30,8 +40,7 @@ def test_version__request_failed(monkeypatch, request_mock):
 
     version = Version(version_number="1.0.0", deployment=Deployment.DEVELOP)
 
-    assert version.latest_version == "1.0.0"
-    assert version.download_url is None
+    assert version.latest_version_info == ("1.0.0", None)
 
 
 def test_version__request_successful(monkeypatch):
@@ -39,5 +48,46 @@ def test_version__request_successful(monkeypatch):
 
     version = Version(version_number="1.0.0", deployment=Deployment.DEVELOP)
 
-    assert version.latest_version == SUCCESS_VERSION
-    assert version.download_url == SUCCESS_URL
+    assert version.latest_version_info == (SUCCESS_VERSION, SUCCESS_URL)
+
+
+def test_version__failed_request_retried(monkeypatch):
+    request_mock = MagicMock(
+        side_effect=[
+            requests.exceptions.RequestException("Timeout or something"),
+            successful_response.return_value,
+        ]
+    )
+    monkeypatch.setattr("requests.get", request_mock)
+    monkeypatch.setattr("monkey_island.cc.version.LATEST_VERSION_RETRY_INTERVAL", 0)
+
+    version = Version(version_number="1.0.0", deployment=Deployment.DEVELOP)
+
+    deadline = time.monotonic() + 5
+    while version.latest_version_info[1] is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert version.latest_version_info == (SUCCESS_VERSION, SUCCESS_URL)
+
+
+def test_version__repeated_failures_logged_at_debug(monkeypatch, caplog):
+    request_mock = MagicMock(
+        side_effect=[
+            requests.exceptions.RequestException("Timeout or something"),
+            invalid_version_response.return_value,
+            failed_response.return_value,
+            successful_response.return_value,
+        ]
+    )
+    monkeypatch.setattr("requests.get", request_mock)
+    monkeypatch.setattr("monkey_island.cc.version.LATEST_VERSION_RETRY_INTERVAL", 0)
+    caplog.set_level(logging.DEBUG, logger="monkey_island.cc.version")
+
+    version = Version(version_number="1.0.0", deployment=Deployment.DEVELOP)
+
+    deadline = time.monotonic() + 5
+    while version.latest_version_info[1] is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert version.latest_version_info == (SUCCESS_VERSION, SUCCESS_URL)
+    assert [r.levelno for r in caplog.records if r.levelno > logging.DEBUG] == [logging.WARNING]